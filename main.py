@@ -1,25 +1,52 @@
+import os
+
+# Thread pinning has to happen before numpy/cv2/tesseract load their
+# OpenMP and BLAS runtimes. Every OCR worker is single-threaded on
+# purpose - parallelism comes from the process pool, so library-level
+# thread pools would only oversubscribe the cores
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
+
 import pytesseract
+try:
+    # Optional in-process tesseract API; avoids a subprocess per OCR call
+    import tesserocr
+except ImportError:
+    tesserocr = None
 import pdf2image
+try:
+    # Optional in-process PDF rasterizer; pdf2image (poppler subprocess)
+    # is the fallback
+    import fitz
+except ImportError:
+    fitz = None
+try:
+    # Optional SIMD image filters; PIL's scalar filters are the fallback
+    import cv2
+except ImportError:
+    cv2 = None
 from PIL import Image, ImageFilter
-from fastapi import FastAPI, File, UploadFile, HTTPException, Form
-from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+from fastapi import FastAPI, File, UploadFile, HTTPException, Form, Request
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
-import os
-import io
-import json
+import gzip
+import orjson
 import asyncio
 from datetime import datetime
 import uuid
 import time
-from difflib import SequenceMatcher
-from collections import Counter
-import gc
+from collections import Counter, OrderedDict
+import numpy as np
+import hashlib
+import concurrent.futures
 import tempfile
-import shutil
 import resource
-import threading
 import re
+import functools
+import types
 import requests
 from typing import Optional
 
@@ -30,26 +57,30 @@ try:
 except:
     pass  # Windows doesn't support this
 
-# Configure aggressive garbage collection
-gc.set_threshold(100, 5, 5)
-
 app = FastAPI(
     title="MAFM OCR API",
     description="Multi-pass OCR verification system for lease document processing with Modal integration",
     version="5.1.0",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    # orjson serializes multi-MB extraction payloads several times faster
+    # than stdlib json
+    default_response_class=ORJSONResponse
 )
 
 app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_credentials=True, allow_methods=["*"], allow_headers=["*"])
 
-# Store processed results in memory with size limit
-processed_results = {}
+# Store processed results in memory with size limit (insertion-ordered LRU)
+processed_results = OrderedDict()
 MAX_RESULTS = 10  # Limit stored results to prevent memory overflow
 
 # Maximum file size: 10MB
 MAX_FILE_SIZE = 10 * 1024 * 1024
 
+def sse(payload):
+    """Encode one server-sent event frame as bytes"""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
 def clean_text_for_json(text):
     """Clean OCR text to be JSON-safe and remove problematic characters"""
     if not text:
@@ -84,60 +115,41 @@ def clean_text_for_json(text):
     
     return text.strip()
 
+# Indicator word sets per language, precompiled once at import. Read-only so
+# the tables can be shared across forked OCR workers without copies
+_LANGUAGE_INDICATORS = types.MappingProxyType({
+    'spanish': frozenset(['contrato', 'arrendamiento', 'locales', 'fecha', 'mes', 'año', 'el', 'la', 'de', 'que', 'y', 'los', 'las', 'con', 'para', 'por']),
+    'french': frozenset(['contrat', 'location', 'locataire', 'bailleur', 'date', 'mois', 'année', 'le', 'la', 'de', 'que', 'et', 'les', 'avec', 'pour', 'par']),
+    'english': frozenset(['contract', 'lease', 'tenant', 'landlord', 'date', 'month', 'year', 'the', 'and', 'of', 'to', 'with', 'for', 'by']),
+    'german': frozenset(['vertrag', 'miete', 'mieter', 'vermieter', 'datum', 'monat', 'jahr', 'der', 'die', 'das', 'und', 'mit', 'für', 'von']),
+    'portuguese': frozenset(['contrato', 'arrendamento', 'locatário', 'senhorio', 'data', 'mês', 'ano', 'o', 'a', 'de', 'que', 'e', 'com', 'para']),
+    'italian': frozenset(['contratto', 'affitto', 'locatore', 'locatario', 'data', 'mese', 'anno', 'il', 'la', 'di', 'che', 'e', 'con', 'per']),
+})
+
+_WORD_RE = re.compile(r'[^\W\d_]+', re.UNICODE)
+
+# Emptiness probe that stops at the first non-space character instead of
+# allocating a stripped copy of a multi-KB page
+_NONSPACE_RE = re.compile(r'\S')
+
 def detect_language_from_text(text):
     """Fast language detection based on common words - no external library needed"""
-    # Only check first 1000 chars for speed
-    sample = text[:1000].lower() if len(text) > 1000 else text.lower()
-    
-    # Count language indicators
-    language_scores = {
-        'spanish': 0,
-        'french': 0,
-        'english': 0,
-        'german': 0,
-        'portuguese': 0,
-        'italian': 0,
-        'chinese': 0,
-        'arabic': 0,
-        'russian': 0
-    }
-    
-    # Spanish indicators
-    spanish_words = ['contrato', 'arrendamiento', 'locales', 'fecha', 'mes', 'año', 'el', 'la', 'de', 'que', 'y', 'los', 'las', 'con', 'para', 'por']
-    for word in spanish_words:
-        if word in sample:
-            language_scores['spanish'] += 1
-    
-    # French indicators
-    french_words = ['contrat', 'location', 'locataire', 'bailleur', 'date', 'mois', 'année', 'le', 'la', 'de', 'que', 'et', 'les', 'avec', 'pour', 'par']
-    for word in french_words:
-        if word in sample:
-            language_scores['french'] += 1
-    
-    # English indicators
-    english_words = ['contract', 'lease', 'tenant', 'landlord', 'date', 'month', 'year', 'the', 'and', 'of', 'to', 'with', 'for', 'by']
-    for word in english_words:
-        if word in sample:
-            language_scores['english'] += 1
-    
-    # German indicators
-    german_words = ['vertrag', 'miete', 'mieter', 'vermieter', 'datum', 'monat', 'jahr', 'der', 'die', 'das', 'und', 'mit', 'für', 'von']
-    for word in german_words:
-        if word in sample:
-            language_scores['german'] += 1
-    
-    # Portuguese indicators
-    portuguese_words = ['contrato', 'arrendamento', 'locatário', 'senhorio', 'data', 'mês', 'ano', 'o', 'a', 'de', 'que', 'e', 'com', 'para']
-    for word in portuguese_words:
-        if word in sample:
-            language_scores['portuguese'] += 1
-    
-    # Italian indicators
-    italian_words = ['contratto', 'affitto', 'locatore', 'locatario', 'data', 'mese', 'anno', 'il', 'la', 'di', 'che', 'e', 'con', 'per']
-    for word in italian_words:
-        if word in sample:
-            language_scores['italian'] += 1
-    
+    # Only check first 1000 chars for speed (slicing is already bounded)
+    return _detect_language_from_sample(text[:1000].lower())
+
+@functools.lru_cache(maxsize=512)
+def _detect_language_from_sample(sample):
+    """Score the language indicators for a lowercased sample (memoized)"""
+    # Tokenize once and intersect against the precompiled indicator sets
+    # instead of scanning the sample per indicator word
+    sample_words = frozenset(_WORD_RE.findall(sample))
+
+    language_scores = {language: 0 for language in _LANGUAGE_INDICATORS}
+    language_scores.update({'chinese': 0, 'arabic': 0, 'russian': 0})
+
+    for language, indicators in _LANGUAGE_INDICATORS.items():
+        language_scores[language] = len(indicators & sample_words)
+
     # Check for Chinese characters
     if any('\u4e00' <= char <= '\u9fff' for char in sample):
         language_scores['chinese'] = 10
@@ -159,52 +171,289 @@ def detect_language_from_text(text):
     
     return detected
 
-def cleanup_old_results():
-    """Remove oldest results if we exceed MAX_RESULTS"""
-    if len(processed_results) > MAX_RESULTS:
-        # Sort by timestamp and remove oldest
-        sorted_results = sorted(processed_results.items(), 
-                               key=lambda x: x[1].get('timestamp', ''), 
-                               reverse=True)
-        processed_results.clear()
-        for file_id, result in sorted_results[:MAX_RESULTS]:
-            processed_results[file_id] = result
-    gc.collect()
+def store_result(file_id, result):
+    """Insert a result, evicting the oldest entries beyond MAX_RESULTS"""
+    processed_results[file_id] = result
+    processed_results.move_to_end(file_id)
+    while len(processed_results) > MAX_RESULTS:
+        processed_results.popitem(last=False)
+
+# Shingle length for the Jaccard similarity estimate
+_SHINGLE_K = 5
+
+def _text_shingles(text):
+    """Build the set of hashed k-character shingles for a text"""
+    if len(text) < _SHINGLE_K:
+        return {hash(text)} if text else set()
+    return {hash(text[i:i + _SHINGLE_K]) for i in range(len(text) - _SHINGLE_K + 1)}
 
 def calculate_confidence(texts):
     """Calculate confidence score based on text similarity"""
     if len(texts) == 1:
         return 100.0
-    
+
+    # Shingled Jaccard is O(length) per text instead of SequenceMatcher's
+    # quadratic cost per pair, so multi-KB pages stay cheap
+    shingle_sets = [_text_shingles(text) for text in texts]
+
     similarities = []
-    for i in range(len(texts)):
-        for j in range(i + 1, len(texts)):
-            ratio = SequenceMatcher(None, texts[i], texts[j]).ratio()
-            similarities.append(ratio * 100)
-    
+    for i in range(len(shingle_sets)):
+        for j in range(i + 1, len(shingle_sets)):
+            a, b = shingle_sets[i], shingle_sets[j]
+            union = len(a | b)
+            if union == 0:
+                similarities.append(100.0)
+            else:
+                similarities.append(len(a & b) / union * 100)
+
     return sum(similarities) / len(similarities) if similarities else 100.0
 
 def get_consensus_text(texts):
-    """Get the most common text or merge similar texts"""
+    """Get the consensus text by majority vote per word position across passes.
+
+    Character-index alignment falls apart as soon as one pass inserts or
+    drops a single character - every later column becomes garbage. Words
+    survive small pixel-level disagreements, so vote per word within
+    matching lines and trust the longest pass when the passes don't even
+    agree on line structure.
+    """
     if len(texts) == 1:
         return texts[0]
-    
-    consensus = []
-    max_len = max(len(text) for text in texts)
-    
-    for i in range(max_len):
-        chars_at_position = []
-        for text in texts:
-            if i < len(text):
-                chars_at_position.append(text[i])
-        
-        if chars_at_position:
-            char_counts = Counter(chars_at_position)
-            consensus.append(char_counts.most_common(1)[0][0])
-    
-    return ''.join(consensus)
 
-async def verify_ocr_extraction(image, verification_level):
+    line_lists = [text.split('\n') for text in texts]
+    if len({len(lines) for lines in line_lists}) != 1:
+        return max(texts, key=len)
+
+    consensus_lines = []
+    for line_group in zip(*line_lists):
+        word_lists = [line.split() for line in line_group]
+        max_words = max((len(words) for words in word_lists), default=0)
+
+        consensus_words = []
+        for position in range(max_words):
+            candidates = [words[position] for words in word_lists if position < len(words)]
+            consensus_words.append(Counter(candidates).most_common(1)[0][0])
+
+        consensus_lines.append(' '.join(consensus_words))
+
+    return '\n'.join(consensus_lines)
+
+# Pool of OCR worker processes, one per core by default (override with
+# OCR_WORKERS). Each tesseract instance is pinned to a single thread via
+# OMP_THREAD_LIMIT above, so parallel passes scale with worker count
+# instead of oversubscribing
+OCR_WORKERS = int(os.environ.get('OCR_WORKERS', os.cpu_count() or 2))
+OCR_POOL = concurrent.futures.ProcessPoolExecutor(max_workers=OCR_WORKERS)
+
+# Admission control for whole documents: pages within one job already
+# spread across every pool worker, so running many documents at once only
+# piles work onto the same cores and inflates every job's latency. Extra
+# documents wait for a slot instead (override with OCR_JOB_LIMIT)
+OCR_JOB_LIMIT = int(os.environ.get('OCR_JOB_LIMIT', max(1, (os.cpu_count() or 2) // 2)))
+_OCR_SEM = asyncio.Semaphore(OCR_JOB_LIMIT)
+
+# Cap the long edge of pages before OCR: tesseract cost scales with pixel
+# count and lease scans beyond ~2000 px gain no accuracy. Raise via env
+# for unusually low-DPI originals
+MAX_IMAGE_EDGE = int(os.environ.get('QUANARA_MAX_EDGE', 2000))
+
+def cap_image_size(image):
+    """Downscale so the long edge stays within MAX_IMAGE_EDGE"""
+    scale = MAX_IMAGE_EDGE / max(image.size)
+    if scale >= 1.0:
+        return image
+    new_size = (max(1, int(image.width * scale)), max(1, int(image.height * scale)))
+    return image.resize(new_size, Image.LANCZOS)
+
+# Same 3x3 kernel PIL uses for ImageFilter.SHARPEN (scale 16)
+_SHARPEN_KERNEL = np.array([[-2, -2, -2], [-2, 32, -2], [-2, -2, -2]], dtype=np.float32) / 16.0
+
+def _binarize_variant(arr):
+    """Binarize: adaptive Gaussian threshold with OpenCV, global 128 fallback.
+
+    The adaptive threshold tracks local illumination, which holds up much
+    better on unevenly lit lease scans than a single global cutoff.
+    """
+    if cv2 is not None:
+        return Image.fromarray(cv2.adaptiveThreshold(arr, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 31, 10))
+    return Image.fromarray(np.where(arr > 128, np.uint8(255), np.uint8(0)))
+
+def _median_variant(arr):
+    """3x3 median filter, using OpenCV's SIMD implementation when available"""
+    if cv2 is not None:
+        return Image.fromarray(cv2.medianBlur(arr, 3))
+    return Image.fromarray(arr).filter(ImageFilter.MedianFilter())
+
+def _sharpen_variant(arr):
+    """Sharpen filter, using OpenCV's SIMD implementation when available"""
+    if cv2 is not None:
+        return Image.fromarray(cv2.filter2D(arr, -1, _SHARPEN_KERNEL))
+    return Image.fromarray(arr).filter(ImageFilter.SHARPEN)
+
+def _estimate_skew_angle(bw):
+    """Estimate page skew by maximizing row-projection variance over +/-5 degrees.
+
+    Text lines only produce sharply peaked row sums when they run
+    horizontally, so the variance of the projection profile is a cheap
+    alignment score. Runs on a 4x-subsampled copy; half-degree steps are
+    plenty of precision for tesseract.
+    """
+    small = bw[::4, ::4]
+    height, width = small.shape
+    best_angle = 0.0
+    best_score = -1.0
+    for angle in np.arange(-5.0, 5.5, 0.5):
+        if cv2 is not None:
+            rotation = cv2.getRotationMatrix2D((width / 2, height / 2), angle, 1.0)
+            rotated = cv2.warpAffine(small, rotation, (width, height), flags=cv2.INTER_NEAREST)
+        else:
+            rotated = np.asarray(Image.fromarray(small).rotate(angle, fillcolor=255))
+        score = rotated.sum(axis=1, dtype=np.int64).var()
+        if score > best_score:
+            best_score = score
+            best_angle = angle
+    return best_angle
+
+# LSTM engine only, uniform block of text (right for lease pages), and skip
+# tesseract's second internal pass for inverted text
+OCR_CONFIG = '--oem 1 --psm 6 -c tessedit_do_invert=0'
+
+# Detected language -> tesseract traineddata string. Every pack listed here
+# ships in the Docker image; English rides along for mixed-language leases
+_TESS_LANGS = types.MappingProxyType({
+    'english': 'eng',
+    'spanish': 'spa+eng',
+    'french': 'fra+eng',
+    'german': 'deu+eng',
+    'portuguese': 'por+eng',
+    'italian': 'ita+eng',
+    'chinese': 'chi_sim+eng',
+    'arabic': 'ara+eng',
+    'russian': 'rus+eng',
+})
+
+def tesseract_lang_for(language):
+    """Tesseract lang string for a detected language name"""
+    return _TESS_LANGS.get(language, 'eng')
+
+# Per-process tesseract handles keyed by language string, created lazily
+# inside each pool worker so each LSTM model is loaded once per process
+# (and only the languages actually requested are loaded at all) instead of
+# once per OCR call
+_WORKER_APIS = {}
+
+def _get_worker_api(lang='eng'):
+    """Return this worker's persistent PyTessBaseAPI for lang, or None without tesserocr"""
+    if tesserocr is None:
+        return None
+    api = _WORKER_APIS.get(lang)
+    if api is None:
+        api = tesserocr.PyTessBaseAPI(
+            lang=lang,
+            oem=tesserocr.OEM.LSTM_ONLY,
+            psm=tesserocr.PSM.SINGLE_BLOCK
+        )
+        api.SetVariable('tessedit_do_invert', '0')
+        _WORKER_APIS[lang] = api
+    return api
+
+def _ocr_gray_frame(frame, lang='eng'):
+    """OCR a raw grayscale frame (bytes, width, height) inside a pool worker.
+
+    SetImageBytes hands the pixels straight to tesseract - no PNG decode,
+    no Leptonica format sniffing, no PIL buffer in between.
+    """
+    raw, width, height = frame
+    api = _get_worker_api(lang)
+    if api is not None:
+        api.SetImageBytes(raw, width, height, 1, width)
+        return api.GetUTF8Text()
+    # Fallback: rebuild a PIL image and spawn the tesseract binary
+    image = Image.frombytes('L', (width, height), raw)
+    return pytesseract.image_to_string(image, lang=lang, config=OCR_CONFIG)
+
+# In-process LRU of page OCR text keyed by image content hash, so repeated
+# form pages and re-streamed documents skip tesseract. Hashing raw page
+# bytes is sub-millisecond against 100ms+ of recognition
+_PAGE_TEXT_CACHE = OrderedDict()
+_PAGE_TEXT_CACHE_MAX = 256
+
+async def _ocr_frame_cached(frame, lang='eng'):
+    """OCR a grayscale frame on the pool, memoized by content hash"""
+    key = (hashlib.sha256(frame[0]).hexdigest(), lang)
+    cached = _PAGE_TEXT_CACHE.get(key)
+    if cached is not None:
+        _PAGE_TEXT_CACHE.move_to_end(key)
+        return cached
+
+    loop = asyncio.get_running_loop()
+    text = await loop.run_in_executor(OCR_POOL, _ocr_gray_frame, frame, lang)
+    _PAGE_TEXT_CACHE[key] = text
+    while len(_PAGE_TEXT_CACHE) > _PAGE_TEXT_CACHE_MAX:
+        _PAGE_TEXT_CACHE.popitem(last=False)
+    return text
+
+def _ocr_image_file(image_path, lang='eng'):
+    """OCR a rendered page file inside a pool worker"""
+    with Image.open(image_path) as image:
+        image = cap_image_size(image)
+        if cv2 is not None:
+            # Hand tesseract a pre-binarized single channel: skips its
+            # internal Leptonica conversion/threshold pass
+            image = _binarize_variant(np.asarray(image.convert('L')))
+        api = _get_worker_api(lang)
+        if api is not None:
+            api.SetImage(image)
+            return api.GetUTF8Text()
+        return pytesseract.image_to_string(image, lang=lang, config=OCR_CONFIG)
+
+def _prepare_pass_frames(image, num_passes):
+    """Build raw grayscale (bytes, width, height) frames for each pass variant.
+
+    Raw single-channel bytes feed tesseract directly through SetImageBytes,
+    skipping the PNG encode here and the decode in the worker - a zlib
+    round-trip per pass on every page.
+    """
+    # Convert to grayscale once up front: tesseract re-derives grayscale from
+    # RGB internally on every pass otherwise, and the single channel is a
+    # third of the bytes to filter, encode and ship to the workers. Oversized
+    # scans are downscaled before anything else touches the pixels
+    gray = cap_image_size(image.convert('L'))
+
+    # Zero-copy view of the grayscale buffer; every pass variant reads from
+    # this single decode instead of copying through new PIL images
+    arr = np.asarray(gray)
+
+    # Blank separator pages are common in lease scans; a near-zero ink
+    # fraction means there is nothing for tesseract to find, so skip the
+    # variant prep and every OCR pass outright
+    if (arr < 200).mean() < 0.001:
+        return []
+
+    # Deskew before building variants: tilted scans smear text across
+    # tesseract's line segmentation. Rotations under half a degree aren't
+    # worth the resample
+    angle = _estimate_skew_angle(np.asarray(_binarize_variant(arr)))
+    if abs(angle) >= 0.5:
+        gray = gray.rotate(angle, resample=Image.BILINEAR, fillcolor=255)
+        arr = np.asarray(gray)
+
+    frames = []
+    for i in range(num_passes):
+        processed_image = gray
+
+        if i == 1:
+            processed_image = _binarize_variant(arr)
+        elif i == 2:
+            processed_image = _median_variant(arr)
+        elif i == 3:
+            processed_image = _sharpen_variant(arr)
+
+        frames.append((processed_image.tobytes(), processed_image.width, processed_image.height))
+
+    return frames
+
+async def verify_ocr_extraction(image, verification_level, lang='eng'):
     """Run OCR multiple times based on verification level"""
     passes = {
         'low': 1,      # Changed to 1 pass for speed
@@ -212,39 +461,35 @@ async def verify_ocr_extraction(image, verification_level):
         'high': 3,     # Changed to 3 passes
         'ultra': 4     # Changed to 4 passes
     }
-    
+
     num_passes = passes.get(verification_level, 1)
-    extracted_texts = []
-    
-    for i in range(num_passes):
-        processed_image = image
-        
-        if i == 1:
-            processed_image = image.point(lambda p: p > 128 and 255)
-        elif i == 2:
-            processed_image = image.filter(ImageFilter.MedianFilter())
-        elif i == 3:
-            processed_image = image.filter(ImageFilter.SHARPEN)
-        
-        text = pytesseract.image_to_string(processed_image)
-        extracted_texts.append(text)
-        
-        # Force garbage collection after each pass
-        if i % 2 == 0:
-            gc.collect()
-        
-        await asyncio.sleep(0.1)
-    
+
+    # Variant prep (decode, filters, deskew) is CPU work - keep it off
+    # the event loop so concurrent streams don't stall each other
+    frames = await asyncio.to_thread(_prepare_pass_frames, image, num_passes)
+
+    # Blank page detected during prep: nothing to OCR
+    if not frames:
+        return {
+            'text': '',
+            'confidence': 100.0,
+            'passes': 0,
+            'variations': 0
+        }
+
+    # Run all tesseract calls in parallel on the process pool so wall-clock
+    # time is ~one pass
+    extracted_texts = list(await asyncio.gather(*[
+        _ocr_frame_cached(frame, lang)
+        for frame in frames
+    ]))
+
     if num_passes == 1:
         final_text = extracted_texts[0]
         confidence = 100.0
     else:
-        final_text = get_consensus_text(extracted_texts)
-        confidence = calculate_confidence(extracted_texts)
-    
-    # Clear the texts list
-    extracted_texts.clear()
-    gc.collect()
+        final_text = await asyncio.to_thread(get_consensus_text, extracted_texts)
+        confidence = await asyncio.to_thread(calculate_confidence, extracted_texts)
     
     return {
         'text': final_text,
@@ -253,6 +498,189 @@ async def verify_ocr_extraction(image, verification_level):
         'variations': num_passes
     }
 
+# On-disk cache of finished extractions keyed by document hash, so
+# re-submitting the same file skips OCR entirely. Hashing is milliseconds
+# against seconds of OCR
+CACHE_DIR = os.environ.get('QUANARA_CACHE_DIR', '/tmp/quanara_cache')
+MAX_CACHE_FILES = 32
+os.makedirs(CACHE_DIR, exist_ok=True)
+
+def file_sha256(path):
+    """SHA-256 of a file on disk, streamed in chunks"""
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+def cache_lookup(cache_key):
+    """Return the cached payload for cache_key, or None on a miss"""
+    cache_path = os.path.join(CACHE_DIR, cache_key + '.json')
+    try:
+        with open(cache_path, 'rb') as cache_file:
+            payload = orjson.loads(cache_file.read())
+        # Touch the entry so eviction stays least-recently-used
+        os.utime(cache_path)
+        return payload
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+def cache_store(cache_key, payload):
+    """Persist a payload and evict the least recently used entries"""
+    try:
+        with open(os.path.join(CACHE_DIR, cache_key + '.json'), 'wb') as cache_file:
+            cache_file.write(orjson.dumps(payload))
+
+        entries = sorted(
+            (entry for entry in os.scandir(CACHE_DIR) if entry.name.endswith('.json')),
+            key=lambda entry: entry.stat().st_mtime
+        )
+        for entry in entries[:-MAX_CACHE_FILES]:
+            os.remove(entry.path)
+    except OSError:
+        pass
+
+def save_upload_to_temp(upload_file, filename):
+    """Stream an upload to a temp file in chunks and enforce MAX_FILE_SIZE.
+
+    Copying straight from the upload's file object avoids buffering the
+    whole body in memory, and the running byte counter rejects oversized
+    uploads the moment they cross the cap instead of writing them out
+    first and checking afterwards.
+    """
+    suffix = os.path.splitext(filename)[1]
+    size = 0
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
+        temp_file_path = temp_file.name
+        while chunk := upload_file.file.read(64 * 1024):
+            size += len(chunk)
+            if size > MAX_FILE_SIZE:
+                break
+            temp_file.write(chunk)
+
+    if size > MAX_FILE_SIZE:
+        try:
+            os.remove(temp_file_path)
+        except OSError:
+            pass
+        raise HTTPException(status_code=413, detail=f"File too large. Maximum size is {MAX_FILE_SIZE/1024/1024}MB")
+
+    return temp_file_path
+
+def save_bytes_to_temp(content, filename):
+    """Write already-downloaded bytes (URL path) to a temp file"""
+    suffix = os.path.splitext(filename)[1]
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
+        temp_file.write(content)
+        return temp_file.name
+
+# Pages rendered (and OCR'd) per batch. Sized to the worker pool so one
+# batch fills every core, clamped so a batch of decoded pages stays well
+# under the memory cap. Override with OCR_PAGE_BATCH on bigger instances
+PAGE_BATCH = int(os.environ.get('OCR_PAGE_BATCH', min(8, max(2, os.cpu_count() or 2))))
+
+def get_pdf_page_count(pdf_path):
+    """Page count from the PDF header, without rasterizing anything"""
+    if fitz is not None:
+        with fitz.open(pdf_path) as doc:
+            return doc.page_count
+    from pdf2image import pdfinfo_from_path
+    return pdfinfo_from_path(pdf_path)['Pages']
+
+# Pages carrying at least this many embedded characters are treated as
+# digitally generated and skip OCR entirely
+MIN_EMBEDDED_CHARS = 100
+
+def get_embedded_page_texts(pdf_path):
+    """Map page number -> embedded text for pages with a native text layer.
+
+    Digitally generated PDFs already carry their text; rasterizing and
+    OCR'ing them reproduces it slower and worse. Needs fitz - without it
+    this returns {} and every page falls through to OCR.
+    """
+    if fitz is None:
+        return {}
+
+    embedded = {}
+    try:
+        with fitz.open(pdf_path) as doc:
+            for page_index in range(doc.page_count):
+                text = doc[page_index].get_text("text")
+                if len(text.strip()) >= MIN_EMBEDDED_CHARS:
+                    embedded[page_index + 1] = text
+    except Exception:
+        return {}
+    return embedded
+
+def iter_pdf_page_chunks(pdf_path, total_pages, dpi=150, skip_pages=()):
+    """Yield lists of (page_number, image_path), rendering one batch at a time.
+
+    PyMuPDF rasterizes in-process when available, skipping the fork+pipe of
+    a poppler subprocess per batch; pdf2image is the fallback. Rendering to
+    JPEG paths instead of in-memory PIL images keeps only one batch of
+    decoded pages resident, and rendered files are removed once the
+    consumer asks for the next batch. Page numbers in skip_pages are not
+    rendered (or, on the poppler path, not yielded).
+    """
+    with tempfile.TemporaryDirectory() as page_dir:
+        doc = fitz.open(pdf_path) if fitz is not None else None
+        if doc is not None and len(doc) > 0:
+            # Rendering past MAX_IMAGE_EDGE is wasted work: cap_image_size
+            # throws the extra pixels away before OCR. Pick the DPI that
+            # lands the first page's long edge at the cap, floored at 100
+            # so small pages still render with enough detail to read.
+            long_edge_pts = max(doc[0].rect.width, doc[0].rect.height)
+            if long_edge_pts > 0:
+                dpi = max(100, min(dpi, int(MAX_IMAGE_EDGE * 72 / long_edge_pts)))
+        # Cleanup trails the consumer by one batch so a caller may keep
+        # using the batch it holds while prefetching the next one
+        stale_paths = []
+        try:
+            for chunk_start in range(0, total_pages, PAGE_BATCH):
+                chunk_end = min(chunk_start + PAGE_BATCH, total_pages)
+
+                if doc is not None:
+                    matrix = fitz.Matrix(dpi / 72, dpi / 72)
+                    chunk = []
+                    for page_index in range(chunk_start, chunk_end):
+                        page_number = page_index + 1
+                        if page_number in skip_pages:
+                            continue
+                        image_path = os.path.join(page_dir, f'page-{page_number}.jpg')
+                        # Render single-channel: OCR grayscales anyway, and
+                        # one channel is a third of the bytes to encode,
+                        # store and decode
+                        pixmap = doc[page_index].get_pixmap(matrix=matrix, alpha=False, colorspace=fitz.csGRAY)
+                        pixmap.save(image_path, jpg_quality=85)
+                        chunk.append((page_number, image_path))
+                else:
+                    image_paths = pdf2image.convert_from_path(
+                        pdf_path,
+                        dpi=dpi,
+                        first_page=chunk_start + 1,
+                        last_page=chunk_end,
+                        thread_count=2,
+                        fmt='jpeg',
+                        grayscale=True,
+                        jpegopt={'quality': 85},
+                        output_folder=page_dir,
+                        paths_only=True
+                    )
+                    chunk = [
+                        (page_number, image_path)
+                        for page_number, image_path in enumerate(image_paths, chunk_start + 1)
+                        if page_number not in skip_pages
+                    ]
+
+                for stale_path in stale_paths:
+                    try:
+                        os.remove(stale_path)
+                    except OSError:
+                        pass
+
+                yield chunk
+                stale_paths = [image_path for _, image_path in chunk]
+        finally:
+            if doc is not None:
+                doc.close()
+
 async def download_file_from_url(url: str) -> tuple[bytes, str]:
     """Download file from URL and return content and filename"""
     try:
@@ -302,108 +730,125 @@ async def download_file_from_url(url: str) -> tuple[bytes, str]:
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error processing URL: {str(e)}")
 
-async def stream_ocr_progress(file_content: bytes, filename: str, file_id: str, verification_level: str = 'low'):
-    """Stream OCR progress with verification passes"""
-    temp_file_path = None
+async def stream_ocr_progress(temp_file_path: str, filename: str, file_id: str, verification_level: str = 'low'):
+    """Stream OCR progress with verification passes.
+
+    The upload has already been streamed to temp_file_path by the endpoint;
+    this generator owns the file and removes it when done.
+    """
+    sem_held = False
     try:
         start_time = time.time()
-        
-        yield f"data: {json.dumps({'type': 'start', 'file_id': file_id, 'filename': filename, 'verification_level': verification_level, 'message': f'Starting processing with {verification_level} verification...', 'start_time': start_time})}\n\n"
-        await asyncio.sleep(0.1)
-        
-        # Save to temp file instead of processing in memory
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(filename)[1]) as temp_file:
-            temp_file.write(file_content)
-            temp_file_path = temp_file.name
-        
-        # Clear the file_content from memory
-        file_content = None
-        gc.collect()
-        
+
+        yield sse({'type': 'start', 'file_id': file_id, 'filename': filename, 'verification_level': verification_level, 'message': f'Starting processing with {verification_level} verification...', 'start_time': start_time})
+
+        # Whole-document replay: a re-streamed file hits the same on-disk
+        # cache the JSON endpoints use and plays back in milliseconds
+        doc_sha = await asyncio.to_thread(file_sha256, temp_file_path)
+        cache_key = f"{doc_sha}-stream-{verification_level}"
+        cached = cache_lookup(cache_key)
+        if cached is not None:
+            store_result(file_id, cached)
+            for page in cached['ocr_pages']:
+                yield sse({'type': 'page_complete', 'file_id': file_id, 'page': page['page'], 'confidence': cached['confidence'], 'passes': 0, 'variations': 0, 'text': page['text'], 'page_time': 0.0})
+            yield sse({'type': 'complete', 'file_id': file_id, 'total_pages': len(cached['ocr_pages']), 'total_chars': cached['character_count'], 'average_confidence': cached['confidence'], 'verification_level': cached['verification_level'], 'detected_language': cached['detected_language'], 'message': 'Processing complete (cached)', 'total_time': round(time.time() - start_time, 1)})
+            return
+
+        # Wait for a document slot so concurrent uploads queue instead of
+        # thrashing the pool; tell the client rather than going silent
+        if _OCR_SEM.locked():
+            yield sse({'type': 'queued', 'file_id': file_id, 'message': 'Waiting for an OCR slot...'})
+        await _OCR_SEM.acquire()
+        sem_held = True
+
         if filename.lower().endswith('.pdf'):
             # Process PDF page by page to avoid loading all pages in memory
             page_texts = []  # Store page-by-page results for Modal format
             total_confidence = 0
-            detected_languages = set()
-            
-            # Get page count first
+
+            # Get page count from the header only - no need to rasterize anything
             try:
-                images = pdf2image.convert_from_path(temp_file_path, dpi=150, first_page=1, last_page=1)
-                # Use pdfinfo to get total pages without loading all
-                from pdf2image import pdfinfo_from_path
-                info = pdfinfo_from_path(temp_file_path)
-                total_pages = info['Pages']
-                images[0] = None  # Clear first page
-                del images
-                gc.collect()
-            except:
+                total_pages = await asyncio.to_thread(get_pdf_page_count, temp_file_path)
+            except Exception:
                 total_pages = 1
-            
-            yield f"data: {json.dumps({'type': 'info', 'file_id': file_id, 'total_pages': total_pages, 'message': f'PDF loaded: {total_pages} pages'})}\n\n"
-            
-            # Process in chunks of 5 pages maximum
-            chunk_size = 5
-            for chunk_start in range(0, total_pages, chunk_size):
-                chunk_end = min(chunk_start + chunk_size, total_pages)
-                
-                # Convert only current chunk
-                images = pdf2image.convert_from_path(
-                    temp_file_path, 
-                    dpi=150,
-                    first_page=chunk_start + 1,
-                    last_page=chunk_end
-                )
-                
-                for i, image in enumerate(images, chunk_start + 1):
+
+            yield sse({'type': 'info', 'file_id': file_id, 'total_pages': total_pages, 'message': f'PDF loaded: {total_pages} pages'})
+
+            # Pages with an embedded text layer are already digital text -
+            # take it as-is and only OCR the image-only pages
+            embedded_pages = await asyncio.to_thread(get_embedded_page_texts, temp_file_path)
+            for i in sorted(embedded_pages):
+                cleaned_page_text = clean_text_for_json(embedded_pages[i])
+                if cleaned_page_text:  # clean_text_for_json already strips
+                    page_texts.append({
+                        "page": i,
+                        "text": cleaned_page_text
+                    })
+                total_confidence += 100.0
+                yield sse({'type': 'page_complete', 'file_id': file_id, 'page': i, 'confidence': 100.0, 'passes': 0, 'variations': 0, 'text': cleaned_page_text, 'page_time': 0.0})
+
+            # OCR model for this document, decided from the first page with
+            # readable text so e.g. Spanish leases use the spa traineddata
+            ocr_lang = None
+            if page_texts:
+                ocr_lang = tesseract_lang_for(await asyncio.to_thread(detect_language_from_text, page_texts[0]["text"]))
+
+            # Double-buffer rendering against OCR: while the pages of one
+            # batch are OCR'd, the next batch renders in a worker thread so
+            # the pool never idles waiting on the rasterizer
+            chunk_iter = iter_pdf_page_chunks(temp_file_path, total_pages, skip_pages=embedded_pages.keys())
+            next_chunk = asyncio.ensure_future(asyncio.to_thread(next, chunk_iter, None))
+            # Only emit progress frames when the percentage moves; on large
+            # PDFs this collapses hundreds of identical events into ~100
+            last_emitted_pct = -1
+            while True:
+                chunk = await next_chunk
+                if chunk is None:
+                    break
+                next_chunk = asyncio.ensure_future(asyncio.to_thread(next, chunk_iter, None))
+
+                for i, image_path in chunk:
                     page_start_time = time.time()
-                    
-                    yield f"data: {json.dumps({'type': 'progress', 'file_id': file_id, 'current_page': i, 'total_pages': total_pages, 'progress': int((i-1)/total_pages * 100), 'message': f'Processing page {i}/{total_pages} with {verification_level} verification', 'elapsed_time': round(time.time() - start_time, 1)})}\n\n"
-                    
-                    result = await verify_ocr_extraction(image, verification_level)
-                    
+
+                    progress_pct = int((i-1)/total_pages * 100)
+                    if progress_pct != last_emitted_pct:
+                        last_emitted_pct = progress_pct
+                        yield sse({'type': 'progress', 'file_id': file_id, 'current_page': i, 'total_pages': total_pages, 'progress': progress_pct, 'message': f'Processing page {i}/{total_pages} with {verification_level} verification', 'elapsed_time': round(time.time() - start_time, 1)})
+
+                    with Image.open(image_path) as image:
+                        result = await verify_ocr_extraction(image, verification_level, ocr_lang or 'eng')
+
                     # Clean the text for this page
                     cleaned_page_text = clean_text_for_json(result['text'])
-                    
-                    if cleaned_page_text.strip():
+
+                    if ocr_lang is None and cleaned_page_text:
+                        ocr_lang = tesseract_lang_for(await asyncio.to_thread(detect_language_from_text, cleaned_page_text))
+
+                    if cleaned_page_text:  # clean_text_for_json already strips
                         # Store in Modal format: {"page": number, "text": "content"}
                         page_texts.append({
                             "page": i,
                             "text": cleaned_page_text
                         })
-                    
+
                     total_confidence += result['confidence']
                     page_time = round(time.time() - page_start_time, 1)
-                    
-                    yield f"data: {json.dumps({'type': 'page_complete', 'file_id': file_id, 'page': i, 'confidence': result['confidence'], 'passes': result['passes'], 'variations': result['variations'], 'text_preview': cleaned_page_text[:200] + '...' if len(cleaned_page_text) > 200 else cleaned_page_text, 'page_time': page_time})}\n\n"
-                    
-                    # Clear image from memory immediately
-                    image.close()
-                    image = None
-                    
-                    # Garbage collect after each page
-                    if i % 2 == 0:
-                        gc.collect()
-                    
-                    await asyncio.sleep(0.1)
-                
-                # Clear the entire chunk from memory
-                for img in images:
-                    if img:
-                        img.close()
-                images.clear()
-                del images
-                gc.collect()
-            
+
+                    yield sse({'type': 'page_complete', 'file_id': file_id, 'page': i, 'confidence': result['confidence'], 'passes': result['passes'], 'variations': result['variations'], 'text': cleaned_page_text, 'page_time': page_time})
+
+            # Embedded-text pages were emitted first; restore document order
+            page_texts.sort(key=lambda page: page["page"])
+
             avg_confidence = total_confidence / total_pages if total_pages > 0 else 0
-            
+
             # Detect language from combined text
             combined_text = " ".join([page["text"] for page in page_texts])
-            detected_language = detect_language_from_text(combined_text)
+            detected_language = await asyncio.to_thread(detect_language_from_text, combined_text)
             
         else:
-            # Process image
-            yield f"data: {json.dumps({'type': 'progress', 'file_id': file_id, 'progress': 50, 'message': f'Processing image with {verification_level} verification...', 'elapsed_time': round(time.time() - start_time, 1)})}\n\n"
-            
+            # Process image. No intermediate progress frame: a single image
+            # is one OCR call, so there is nothing between start and the
+            # page_complete below worth an extra emit
             image = Image.open(temp_file_path)
             result = await verify_ocr_extraction(image, verification_level)
             
@@ -413,20 +858,19 @@ async def stream_ocr_progress(file_content: bytes, filename: str, file_id: str,
             # Format as single page for Modal
             page_texts = [{"page": 1, "text": cleaned_text}]
             avg_confidence = result['confidence']
-            
+
+            yield sse({'type': 'page_complete', 'file_id': file_id, 'page': 1, 'confidence': result['confidence'], 'passes': result['passes'], 'variations': result['variations'], 'text': cleaned_text, 'page_time': round(time.time() - start_time, 1)})
+
             # Detect language from the cleaned text
-            detected_language = detect_language_from_text(cleaned_text)
+            detected_language = await asyncio.to_thread(detect_language_from_text, cleaned_text)
             
             image.close()
             image = None
         
         total_time = round(time.time() - start_time, 1)
         
-        # Cleanup old results before storing new one
-        cleanup_old_results()
-        
-        # Store result with page format for Modal
-        processed_results[file_id] = {
+        # Store result with page format for Modal (evicts oldest beyond cap)
+        result_record = {
             'filename': filename,
             'ocr_pages': page_texts,  # This is the key format Modal expects
             'confidence': avg_confidence,
@@ -437,22 +881,28 @@ async def stream_ocr_progress(file_content: bytes, filename: str, file_id: str,
             'total_pages': len(page_texts),
             'character_count': sum(len(page["text"]) for page in page_texts)
         }
-        
+        store_result(file_id, result_record)
+        cache_store(cache_key, result_record)
+
         # Calculate total characters
         total_chars = sum(len(page["text"]) for page in page_texts)
         
-        yield f"data: {json.dumps({'type': 'complete', 'file_id': file_id, 'ocr_pages': page_texts, 'total_chars': total_chars, 'average_confidence': avg_confidence, 'verification_level': verification_level, 'detected_language': detected_language, 'message': f'Processing complete! Average confidence: {avg_confidence:.1f}%', 'total_time': total_time})}\n\n"
+        # Page text already went out in the page_complete events; re-shipping
+        # the whole document in one frame would json-encode a multi-MB blob
+        # and stall both ends on large PDFs
+        yield sse({'type': 'complete', 'file_id': file_id, 'total_pages': len(page_texts), 'total_chars': total_chars, 'average_confidence': avg_confidence, 'verification_level': verification_level, 'detected_language': detected_language, 'message': f'Processing complete! Average confidence: {avg_confidence:.1f}%', 'total_time': total_time})
         
     except Exception as e:
-        yield f"data: {json.dumps({'type': 'error', 'file_id': file_id, 'error': str(e)})}\n\n"
+        yield sse({'type': 'error', 'file_id': file_id, 'error': str(e)})
     finally:
+        if sem_held:
+            _OCR_SEM.release()
         # Always cleanup temp file
         if temp_file_path and os.path.exists(temp_file_path):
             try:
                 os.remove(temp_file_path)
             except:
                 pass
-        gc.collect()
 
 # NEW ENDPOINT FOR MODAL INTEGRATION
 @app.post("/extract-for-modal")
@@ -471,78 +921,97 @@ async def extract_for_modal(
         "metadata": {...}
     }
     """
-    # Get content from either file upload or URL
+    # Get a temp file from either the upload (streamed in chunks) or a URL
     if file_url and not file:
         content, filename = await download_file_from_url(file_url)
+        temp_file_path = save_bytes_to_temp(content, filename)
+        content = None
     elif file:
-        content = await file.read()
         filename = file.filename
+        temp_file_path = save_upload_to_temp(file, filename)
     else:
         raise HTTPException(status_code=400, detail="Either file or file_url must be provided")
-    
-    # Check file size
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(status_code=413, detail=f"File too large. Maximum size is {MAX_FILE_SIZE/1024/1024}MB")
-    
-    temp_file_path = None
+
+    sem_held = False
     try:
-        # Save to temp file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(filename)[1]) as temp_file:
-            temp_file.write(content)
-            temp_file_path = temp_file.name
-        
-        # Clear content from memory
-        content = None
-        gc.collect()
-        
+        doc_sha = await asyncio.to_thread(file_sha256, temp_file_path)
+        cache_key = f"{doc_sha}-modal-{verification_level}"
+        cached = cache_lookup(cache_key)
+        if cached is not None:
+            return ORJSONResponse(cached)
+
+        # Same document slot the streaming path waits on; JSON clients
+        # simply block until one frees up
+        await _OCR_SEM.acquire()
+        sem_held = True
+
         page_texts = []
         total_confidence = 0
-        
+
         if filename.lower().endswith('.pdf'):
             # Process page by page
-            from pdf2image import pdfinfo_from_path
-            info = pdfinfo_from_path(temp_file_path)
-            total_pages = info['Pages']
-            
-            # Process in chunks
-            chunk_size = 5
-            for chunk_start in range(0, total_pages, chunk_size):
-                chunk_end = min(chunk_start + chunk_size, total_pages)
-                
-                images = pdf2image.convert_from_path(
-                    temp_file_path,
-                    dpi=150,
-                    first_page=chunk_start + 1,
-                    last_page=chunk_end
-                )
-                
-                for i, image in enumerate(images, chunk_start + 1):
-                    # Run OCR with verification
-                    result = await verify_ocr_extraction(image, verification_level)
-                    
-                    # Clean the text
+            total_pages = get_pdf_page_count(temp_file_path)
+
+            # Pages with an embedded text layer are already digital text -
+            # take it as-is and only OCR the image-only pages
+            embedded_pages = await asyncio.to_thread(get_embedded_page_texts, temp_file_path)
+            for i in sorted(embedded_pages):
+                cleaned_text = clean_text_for_json(embedded_pages[i])
+                if cleaned_text:  # clean_text_for_json already strips
+                    page_texts.append({
+                        "page": i,
+                        "text": cleaned_text
+                    })
+                total_confidence += 100.0
+
+            # OCR model for this document, decided from the first page with
+            # readable text so e.g. Spanish leases use the spa traineddata
+            ocr_lang = None
+            if page_texts:
+                ocr_lang = tesseract_lang_for(detect_language_from_text(page_texts[0]["text"]))
+
+            # OCR each rendered batch of pages concurrently: every page's
+            # passes land on the process pool, so a batch keeps all cores
+            # busy instead of waiting page by page. Batches render in a
+            # worker thread (double-buffered against OCR, same as the
+            # streaming path) so rasterization never blocks the event loop
+            chunk_iter = iter_pdf_page_chunks(temp_file_path, total_pages, skip_pages=embedded_pages.keys())
+            next_chunk = asyncio.ensure_future(asyncio.to_thread(next, chunk_iter, None))
+            while True:
+                chunk = await next_chunk
+                if chunk is None:
+                    break
+                next_chunk = asyncio.ensure_future(asyncio.to_thread(next, chunk_iter, None))
+
+                images = [Image.open(image_path) for _, image_path in chunk]
+                try:
+                    results = await asyncio.gather(*[
+                        verify_ocr_extraction(image, verification_level, ocr_lang or 'eng')
+                        for image in images
+                    ])
+                finally:
+                    for image in images:
+                        image.close()
+
+                if ocr_lang is None:
+                    sample = next((result['text'] for result in results if _NONSPACE_RE.search(result['text'])), '')
+                    if sample:
+                        ocr_lang = tesseract_lang_for(detect_language_from_text(sample))
+
+                for (i, _), result in zip(chunk, results):
                     cleaned_text = clean_text_for_json(result['text'])
-                    
-                    if cleaned_text.strip():
+
+                    if cleaned_text:  # clean_text_for_json already strips
                         page_texts.append({
                             "page": i,
                             "text": cleaned_text
                         })
-                    
+
                     total_confidence += result['confidence']
-                    
-                    # Clear image
-                    image.close()
-                    image = None
-                
-                # Clear chunk
-                for img in images:
-                    if img:
-                        img.close()
-                images.clear()
-                del images
-                gc.collect()
-            
+
+            # Embedded-text pages were collected first; restore document order
+            page_texts.sort(key=lambda page: page["page"])
+
             avg_confidence = total_confidence / total_pages if total_pages > 0 else 0
         else:
             # Process single image
@@ -560,11 +1029,9 @@ async def extract_for_modal(
         # Detect language from combined text
         combined_text = " ".join([page["text"] for page in page_texts])
         detected_language = detect_language_from_text(combined_text)
-        
-        gc.collect()
-        
+
         # Return in EXACT format Modal expects
-        return JSONResponse({
+        payload = {
             "ocr_pages": page_texts,
             "filename": filename,
             "metadata": {
@@ -575,18 +1042,21 @@ async def extract_for_modal(
                 "character_count": sum(len(page["text"]) for page in page_texts),
                 "processing_timestamp": datetime.now().isoformat()
             }
-        })
-        
+        }
+        cache_store(cache_key, payload)
+        return ORJSONResponse(payload)
+
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
     finally:
+        if sem_held:
+            _OCR_SEM.release()
         # Always cleanup temp file
         if temp_file_path and os.path.exists(temp_file_path):
             try:
                 os.remove(temp_file_path)
             except:
                 pass
-        gc.collect()
 
 # Updated extract endpoint with URL support
 @app.post("/extract")
@@ -606,113 +1076,128 @@ async def extract_text(
         "language_detection": "english"
     }
     """
-    # Get content from either file upload or URL
+    # Get a temp file from either the upload (streamed in chunks) or a URL
     if file_url and not file:
         content, filename = await download_file_from_url(file_url)
+        temp_file_path = save_bytes_to_temp(content, filename)
+        content = None
     elif file:
-        content = await file.read()
         filename = file.filename
+        temp_file_path = save_upload_to_temp(file, filename)
     else:
         raise HTTPException(status_code=400, detail="Either file or file_url must be provided")
-    
-    # Check file size
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(status_code=413, detail=f"File too large. Maximum size is {MAX_FILE_SIZE/1024/1024}MB")
-    
-    temp_file_path = None
+
+    sem_held = False
     try:
-        # Save to temp file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(filename)[1]) as temp_file:
-            temp_file.write(content)
-            temp_file_path = temp_file.name
-        
-        # Clear content from memory
-        content = None
-        gc.collect()
-        
+        doc_sha = await asyncio.to_thread(file_sha256, temp_file_path)
+        cache_key = f"{doc_sha}-extract"
+        cached = cache_lookup(cache_key)
+        if cached is not None:
+            return ORJSONResponse(cached)
+
+        # Same document slot the streaming path waits on; JSON clients
+        # simply block until one frees up
+        await _OCR_SEM.acquire()
+        sem_held = True
+
         pages = []
-        
+
         if filename.lower().endswith('.pdf'):
             # Process page by page
-            # Get page count
-            from pdf2image import pdfinfo_from_path
-            info = pdfinfo_from_path(temp_file_path)
-            total_pages = info['Pages']
-            
-            # Process in chunks
-            chunk_size = 5
-            for chunk_start in range(0, total_pages, chunk_size):
-                chunk_end = min(chunk_start + chunk_size, total_pages)
-                
-                images = pdf2image.convert_from_path(
-                    temp_file_path,
-                    dpi=150,
-                    first_page=chunk_start + 1,
-                    last_page=chunk_end
-                )
-                
-                for i, image in enumerate(images, chunk_start + 1):
-                    text = pytesseract.image_to_string(image)
+            total_pages = get_pdf_page_count(temp_file_path)
+
+            # Pages with an embedded text layer are already digital text -
+            # take it as-is and only OCR the image-only pages
+            embedded_pages = await asyncio.to_thread(get_embedded_page_texts, temp_file_path)
+            for i in sorted(embedded_pages):
+                cleaned_text = clean_text_for_json(embedded_pages[i])
+                if cleaned_text:  # clean_text_for_json already strips
+                    pages.append({
+                        "page_number": i,
+                        "text": cleaned_text
+                    })
+
+            # OCR model for this document, decided from the first page with
+            # readable text so e.g. Spanish leases use the spa traineddata
+            ocr_lang = None
+            if pages:
+                ocr_lang = tesseract_lang_for(detect_language_from_text(pages[0]["text"]))
+
+            # Fan each rendered batch across the worker pool; page OCR is
+            # independent, so throughput scales with core count. Batches
+            # render in a worker thread (double-buffered against OCR, same
+            # as the streaming path) so rasterization never blocks the
+            # event loop
+            loop = asyncio.get_running_loop()
+            chunk_iter = iter_pdf_page_chunks(temp_file_path, total_pages, skip_pages=embedded_pages.keys())
+            next_chunk = asyncio.ensure_future(asyncio.to_thread(next, chunk_iter, None))
+            while True:
+                chunk = await next_chunk
+                if chunk is None:
+                    break
+                next_chunk = asyncio.ensure_future(asyncio.to_thread(next, chunk_iter, None))
+
+                texts = await asyncio.gather(*[
+                    loop.run_in_executor(OCR_POOL, _ocr_image_file, image_path, ocr_lang or 'eng')
+                    for _, image_path in chunk
+                ])
+
+                if ocr_lang is None:
+                    sample = next((text for text in texts if _NONSPACE_RE.search(text)), '')
+                    if sample:
+                        ocr_lang = tesseract_lang_for(detect_language_from_text(sample))
+
+                for (i, _), text in zip(chunk, texts):
                     cleaned_text = clean_text_for_json(text)
-                    
-                    if cleaned_text.strip():
+
+                    if cleaned_text:  # clean_text_for_json already strips
                         pages.append({
                             "page_number": i,
                             "text": cleaned_text
                         })
-                    
-                    # Clear image
-                    image.close()
-                    image = None
-                
-                # Clear chunk
-                for img in images:
-                    if img:
-                        img.close()
-                images.clear()
-                del images
-                gc.collect()
-            
+
+            pages.sort(key=lambda page: page["page_number"])
+
         else:
-            image = Image.open(temp_file_path)
-            text = pytesseract.image_to_string(image)
+            # Single images go through the same pool workers as PDF pages,
+            # reusing their warm tesseract handles
+            loop = asyncio.get_running_loop()
+            text = await loop.run_in_executor(OCR_POOL, _ocr_image_file, temp_file_path)
             cleaned_text = clean_text_for_json(text)
-            
+
             pages = [{
                 "page_number": 1,
                 "text": cleaned_text
             }]
-            
-            image.close()
-            image = None
-        
+
         # Combine all text for language detection
         combined_text = " ".join([page["text"] for page in pages])
         detected_language = detect_language_from_text(combined_text)
         
         # Calculate total characters
         total_chars = sum(len(page["text"]) for page in pages)
-        
-        gc.collect()
-        
-        return JSONResponse({
+
+        payload = {
             "pages": pages,
             "filename": filename,
             "page_count": len(pages),
             "character_count": total_chars,
             "language_detection": detected_language
-        })
-        
+        }
+        cache_store(cache_key, payload)
+        return ORJSONResponse(payload)
+
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
     finally:
+        if sem_held:
+            _OCR_SEM.release()
         # Always cleanup temp file
         if temp_file_path and os.path.exists(temp_file_path):
             try:
                 os.remove(temp_file_path)
             except:
                 pass
-        gc.collect()
 
 @app.post("/stream-extract")
 async def stream_extract(
@@ -731,26 +1216,24 @@ async def stream_extract(
     - high: 3 passes (extract + 2 verify)  
     - ultra: 4 passes (extract + 3 verify)
     """
-    # Get content from either file upload or URL
+    # Get a temp file from either the upload (streamed in chunks) or a URL
     if file_url and not file:
         content, filename = await download_file_from_url(file_url)
+        temp_file_path = save_bytes_to_temp(content, filename)
+        content = None
     elif file:
-        content = await file.read()
         filename = file.filename
+        temp_file_path = save_upload_to_temp(file, filename)
     else:
         raise HTTPException(status_code=400, detail="Either file or file_url must be provided")
-    
-    # Check file size
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(status_code=413, detail=f"File too large. Maximum size is {MAX_FILE_SIZE/1024/1024}MB")
-    
+
     file_id = file_id or str(uuid.uuid4())
-    
+
     if verification_level not in ['low', 'medium', 'high', 'ultra']:
         verification_level = 'low'
-    
+
     return StreamingResponse(
-        stream_ocr_progress(content, filename, file_id, verification_level),
+        stream_ocr_progress(temp_file_path, filename, file_id, verification_level),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -759,253 +1242,35 @@ async def stream_extract(
         }
     )
 
-@app.get("/", response_class=HTMLResponse)
-async def main():
-    return """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>MAFM OCR API v5.1 - Modal Integration with URL Support</title>
-    <style>
-        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; margin: 0; padding: 20px; background: #f5f5f5; }
-        .container { max-width: 800px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
-        h1 { color: #333; text-align: center; }
-        .upload-area { border: 2px dashed #ddd; padding: 40px; text-align: center; border-radius: 10px; margin: 20px 0; }
-        .upload-area.drag-over { border-color: #007bff; background: #f0f8ff; }
-        input[type="file"] { display: none; }
-        .btn { background: #007bff; color: white; padding: 12px 24px; border: none; border-radius: 5px; cursor: pointer; margin: 10px; }
-        .btn:hover { background: #0056b3; }
-        .progress { width: 100%; height: 20px; background: #f0f0f0; border-radius: 10px; overflow: hidden; margin: 10px 0; }
-        .progress-bar { height: 100%; background: #007bff; transition: width 0.3s; }
-        .result { margin: 20px 0; padding: 20px; background: #f8f9fa; border-radius: 5px; }
-        .hidden { display: none; }
-        .modal-format { background: #e8f5e8; border: 1px solid #28a745; padding: 15px; border-radius: 5px; margin: 10px 0; }
-        .new-feature { background: #fff3cd; border: 1px solid #ffc107; padding: 15px; border-radius: 5px; margin: 10px 0; }
-        .url-input { width: 100%; padding: 10px; margin: 10px 0; border: 1px solid #ddd; border-radius: 5px; }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>MAFM OCR API v5.1</h1>
-        <p>Upload PDF or image files for text extraction with Modal Hunyuan integration.</p>
-        
-        <div class="new-feature">
-            <h3>🆕 URL Support Added!</h3>
-            <p>You can now process files directly from URLs without downloading them first.</p>
-            <p><strong>Example:</strong> <code>POST /extract?file_url=https://example.com/document.pdf</code></p>
-        </div>
-        
-        <div class="modal-format">
-            <h3>✅ Modal Integration Ready</h3>
-            <p>This OCR system outputs the exact format needed for your Hunyuan translation system.</p>
-            <p><strong>Endpoints:</strong></p>
-            <ul>
-                <li><code>/extract</code> - Basic extraction (supports file upload or URL)</li>
-                <li><code>/extract-for-modal</code> - Modal-specific format (supports file upload or URL)</li>
-            </ul>
-        </div>
-        
-        <div class="upload-area" id="uploadArea">
-            <p>Drag and drop files here or click to select</p>
-            <input type="file" id="fileInput" accept=".pdf,.png,.jpg,.jpeg,.tiff,.bmp" multiple>
-            <button class="btn" onclick="document.getElementById('fileInput').click()">Select Files</button>
-        </div>
-        
-        <div>
-            <h3>Or Process from URL:</h3>
-            <input type="text" class="url-input" id="urlInput" placeholder="Enter file URL (e.g., https://example.com/document.pdf)">
-            <button class="btn" onclick="processUrl()">Process URL</button>
-        </div>
-        
-        <div>
-            <label>Verification Level:</label>
-            <select id="verificationLevel">
-                <option value="low">Low (1 pass - fastest)</option>
-                <option value="medium" selected>Medium (2 passes - recommended)</option>
-                <option value="high">High (3 passes)</option>
-                <option value="ultra">Ultra (4 passes - most accurate)</option>
-            </select>
-        </div>
-        
-        <div id="results"></div>
-    </div>
+# Landing page is read, gzipped and tagged once at import time; serving the
+# cached bytes avoids rebuilding the multi-KB blob on every request
+_STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+with open(os.path.join(_STATIC_DIR, 'index.html'), 'rb') as _index_file:
+    _INDEX_HTML = _index_file.read()
+_INDEX_HTML_GZ = gzip.compress(_INDEX_HTML, compresslevel=9)
+_INDEX_ETAG = '"' + hashlib.sha256(_INDEX_HTML).hexdigest()[:16] + '"'
 
-    <script>
-        const uploadArea = document.getElementById('uploadArea');
-        const fileInput = document.getElementById('fileInput');
-        const results = document.getElementById('results');
-        
-        uploadArea.addEventListener('dragover', (e) => {
-            e.preventDefault();
-            uploadArea.classList.add('drag-over');
-        });
-        
-        uploadArea.addEventListener('dragleave', () => {
-            uploadArea.classList.remove('drag-over');
-        });
-        
-        uploadArea.addEventListener('drop', (e) => {
-            e.preventDefault();
-            uploadArea.classList.remove('drag-over');
-            handleFiles(e.dataTransfer.files);
-        });
-        
-        fileInput.addEventListener('change', (e) => {
-            handleFiles(e.target.files);
-        });
-        
-        function handleFiles(files) {
-            Array.from(files).forEach(file => processFile(file));
-        }
-        
-        function processUrl() {
-            const url = document.getElementById('urlInput').value.trim();
-            if (!url) {
-                alert('Please enter a URL');
-                return;
-            }
-            
-            const fileId = Date.now() + '_' + Math.random().toString(36).substr(2, 9);
-            const verificationLevel = document.getElementById('verificationLevel').value;
-            const filename = url.split('/').pop().split('?')[0] || 'document.pdf';
-            
-            const resultDiv = document.createElement('div');
-            resultDiv.className = 'result';
-            resultDiv.innerHTML = `
-                <h3>${filename} (from URL)</h3>
-                <div class="progress">
-                    <div class="progress-bar" id="progress-${fileId}"></div>
-                </div>
-                <div id="status-${fileId}">Starting...</div>
-                <div id="text-${fileId}" class="hidden"></div>
-            `;
-            results.appendChild(resultDiv);
-            
-            const formData = new FormData();
-            formData.append('file_url', url);
-            formData.append('file_id', fileId);
-            formData.append('verification_level', verificationLevel);
-            
-            fetch('/stream-extract', {
-                method: 'POST',
-                body: formData
-            }).then(response => {
-                if (!response.ok) {
-                    throw new Error('Network response was not ok');
-                }
-                const reader = response.body.getReader();
-                
-                function readStream() {
-                    reader.read().then(({ done, value }) => {
-                        if (done) return;
-                        
-                        const text = new TextDecoder().decode(value);
-                        const lines = text.split('\n');
-                        
-                        lines.forEach(line => {
-                            if (line.startsWith('data: ')) {
-                                try {
-                                    const data = JSON.parse(line.substring(6));
-                                    updateProgress(fileId, data);
-                                } catch (e) {}
-                            }
-                        });
-                        
-                        readStream();
-                    });
-                }
-                
-                readStream();
-            }).catch(error => {
-                document.getElementById(`status-${fileId}`).innerHTML = `❌ Error: ${error.message}`;
-            });
-        }
-        
-        function processFile(file) {
-            const fileId = Date.now() + '_' + Math.random().toString(36).substr(2, 9);
-            const verificationLevel = document.getElementById('verificationLevel').value;
-            
-            const resultDiv = document.createElement('div');
-            resultDiv.className = 'result';
-            resultDiv.innerHTML = `
-                <h3>${file.name}</h3>
-                <div class="progress">
-                    <div class="progress-bar" id="progress-${fileId}"></div>
-                </div>
-                <div id="status-${fileId}">Starting...</div>
-                <div id="text-${fileId}" class="hidden"></div>
-            `;
-            results.appendChild(resultDiv);
-            
-            const formData = new FormData();
-            formData.append('file', file);
-            formData.append('file_id', fileId);
-            formData.append('verification_level', verificationLevel);
-            
-            fetch('/stream-extract', {
-                method: 'POST',
-                body: formData
-            }).then(response => {
-                const reader = response.body.getReader();
-                
-                function readStream() {
-                    reader.read().then(({ done, value }) => {
-                        if (done) return;
-                        
-                        const text = new TextDecoder().decode(value);
-                        const lines = text.split('\n');
-                        
-                        lines.forEach(line => {
-                            if (line.startsWith('data: ')) {
-                                try {
-                                    const data = JSON.parse(line.substring(6));
-                                    updateProgress(fileId, data);
-                                } catch (e) {}
-                            }
-                        });
-                        
-                        readStream();
-                    });
-                }
-                
-                readStream();
-            });
-        }
-        
-        function updateProgress(fileId, data) {
-            const progressBar = document.getElementById(`progress-${fileId}`);
-            const status = document.getElementById(`status-${fileId}`);
-            const textDiv = document.getElementById(`text-${fileId}`);
-            
-            if (data.type === 'progress') {
-                progressBar.style.width = data.progress + '%';
-                status.textContent = data.message;
-            } else if (data.type === 'complete') {
-                progressBar.style.width = '100%';
-                status.innerHTML = `✅ ${data.message}`;
-                
-                // Show Modal format
-                const modalFormat = data.ocr_pages ? JSON.stringify(data.ocr_pages, null, 2) : 'No page data';
-                textDiv.innerHTML = `
-                    <h4>Modal Format Output:</h4>
-                    <pre style="white-space: pre-wrap; background: #e8f5e8; padding: 15px; border-radius: 5px; border: 1px solid #28a745; max-height: 300px; overflow-y: auto;">${modalFormat}</pre>
-                    <p><strong>Ready for Modal Hunyuan processing!</strong></p>
-                `;
-                textDiv.classList.remove('hidden');
-            } else if (data.type === 'error') {
-                status.innerHTML = `❌ Error: ${data.error}`;
-            }
-        }
-    </script>
-</body>
-</html>"""
+@app.get("/", response_class=HTMLResponse)
+async def main(request: Request):
+    headers = {
+        'ETag': _INDEX_ETAG,
+        'Cache-Control': 'public, max-age=3600, must-revalidate',
+        # The body varies by Accept-Encoding; without this a shared cache
+        # may replay the gzipped variant to clients that never offered gzip
+        'Vary': 'Accept-Encoding'
+    }
+    # Strong ETag lets returning browsers short-circuit with a 304
+    if request.headers.get('if-none-match') == _INDEX_ETAG:
+        return Response(status_code=304, headers=headers)
+    if 'gzip' in request.headers.get('accept-encoding', ''):
+        headers['Content-Encoding'] = 'gzip'
+        return Response(content=_INDEX_HTML_GZ, media_type='text/html; charset=utf-8', headers=headers)
+    return Response(content=_INDEX_HTML, media_type='text/html; charset=utf-8', headers=headers)
 
 @app.get("/api/results")
 async def list_results():
     """Get list of all processed documents"""
-    cleanup_old_results()
-    return JSONResponse([
+    return ORJSONResponse([
         {
             "file_id": file_id,
             "filename": result["filename"],
@@ -1024,7 +1289,7 @@ async def get_result(file_id: str):
     if file_id not in processed_results:
         raise HTTPException(status_code=404, detail="Result not found")
     
-    return JSONResponse(processed_results[file_id])
+    return ORJSONResponse(processed_results[file_id])
 
 @app.get("/api/download/{file_id}")
 async def download_result(file_id: str):
@@ -1034,9 +1299,16 @@ async def download_result(file_id: str):
     
     result = processed_results[file_id]
     filename = result["filename"].rsplit('.', 1)[0] + "_extracted.txt"
-    
+    data = "\n\n".join(page["text"] for page in result["ocr_pages"]).encode('utf-8')
+
+    async def text_chunks(chunk_size=64 * 1024):
+        # Must stay an async generator: a sync iterator makes Starlette
+        # bounce every chunk through the threadpool
+        for offset in range(0, len(data), chunk_size):
+            yield data[offset:offset + chunk_size]
+
     return StreamingResponse(
-        io.BytesIO(result["text"].encode('utf-8')),
+        text_chunks(),
         media_type="text/plain",
         headers={
             "Content-Disposition": f'attachment; filename="{filename}"'
@@ -1055,17 +1327,21 @@ async def get_available_languages():
     except Exception as e:
         return {"error": str(e)}
 
-# Background garbage collection thread
-def periodic_gc():
-    """Run garbage collection every 30 seconds"""
-    while True:
-        time.sleep(30)
-        gc.collect()
-        cleanup_old_results()
+@app.on_event("startup")
+async def warm_ocr_workers():
+    """Load the tesseract models in the pool workers before the first request.
+
+    Without this the first upload pays the traineddata load in every
+    worker it touches; at container boot that cost is absorbed by the
+    startup CPU boost instead.
+    """
+    frame = (b'\xff' * 64, 8, 8)  # blank 8x8 grayscale page
 
-# Start GC thread
-gc_thread = threading.Thread(target=periodic_gc, daemon=True)
-gc_thread.start()
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*[
+        loop.run_in_executor(OCR_POOL, _ocr_gray_frame, frame, 'eng')
+        for _ in range(OCR_WORKERS)
+    ])
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8080))
@@ -1075,4 +1351,10 @@ if __name__ == "__main__":
     print(f"Verification levels: low=1 pass, medium=2 passes, high=3 passes, ultra=4 passes")
     print(f"NEW: URL support added - all endpoints can now accept file_url parameter")
     print(f"NEW: /extract-for-modal endpoint - outputs format for Hunyuan processing")
-    uvicorn.run(app, host="0.0.0.0", port=port, log_level="info")
+    # uvloop + httptools cut per-frame event-loop overhead, which matters
+    # for /stream-extract connections that stay open yielding SSE frames.
+    # Access logging is off: one line per request plus one per SSE poll is
+    # pure syscall overhead on the hot path. Single uvicorn worker on
+    # purpose - results and caches live in this process, and the OCR pool
+    # already uses every core
+    uvicorn.run(app, host="0.0.0.0", port=port, log_level="warning", loop="uvloop", http="httptools", access_log=False)